@@ -10,13 +10,17 @@ sys.path.insert(0, str(ROOT_DIR))
 
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Tuple
 
 import MetaTrader5 as mt5
 
 from src.backtest.costs import TradingCosts
 from src.backtest.engine import run_backtest
 from src.backtest.metrics import compute_metrics
-from src.config import load_config
+from src.config import AppConfig, load_config
 from src.data.loader import load_parquet
 from src.execution.mt5_adapter import MT5Adapter
 from src.utils.logging import configure_logging, get_logger
@@ -24,33 +28,30 @@ from src.utils.logging import configure_logging, get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_POINT = 0.0001
+DEFAULT_TICK_VALUE = 10.0
 
-def main() -> None:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--config", default="config.yaml")
-    parser.add_argument("--symbol", required=True)
-    parser.add_argument("--initial-balance", type=float, default=10000)
-    args = parser.parse_args()
-
-    configure_logging()
-    config = load_config(args.config)
-
-    data_path = f"{config.data.output_dir}/{args.symbol}_{config.timeframe}.parquet"
-    df = load_parquet(data_path, tz=config.data.timezone)
 
+def symbol_point_values(symbols: List[str]) -> Dict[str, Tuple[float, float]]:
+    values = {symbol: (DEFAULT_POINT, DEFAULT_TICK_VALUE) for symbol in symbols}
     adapter = MT5Adapter(retry_attempts=1, retry_backoff_seconds=1)
-    point = 0.0001
-    tick_value = 10.0
     if adapter.initialize():
-        info = mt5.symbol_info(args.symbol)
-        if info is not None:
-            point = info.point
-            tick_value = info.trade_tick_value
+        for symbol in symbols:
+            info = mt5.symbol_info(symbol)
+            if info is not None:
+                values[symbol] = (info.point, info.trade_tick_value)
         adapter.shutdown()
+    return values
+
+
+def run_symbol(symbol: str, config: AppConfig, initial_balance: float, point_value: Tuple[float, float]) -> Dict:
+    point, tick_value = point_value
+    data_path = f"{config.data.output_dir}/{symbol}_{config.timeframe}.parquet"
+    df = load_parquet(data_path, tz=config.data.timezone, columns=["time", "open", "high", "low", "close", "tick_volume"])
 
     result = run_backtest(
         df=df,
-        initial_balance=args.initial_balance,
+        initial_balance=initial_balance,
         breakout_N=config.strategy.breakout_N,
         atr_period=config.strategy.atr_period,
         atr_min=config.strategy.atr_min,
@@ -67,9 +68,34 @@ def main() -> None:
             slippage_points=config.backtest.slippage_points,
         ),
     )
+    return compute_metrics(result.equity_curve, result.trades).__dict__
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--symbol", nargs="+", required=True)
+    parser.add_argument("--initial-balance", type=float, default=10000)
+    args = parser.parse_args()
+
+    configure_logging()
+    config = load_config(args.config)
 
-    metrics = compute_metrics(result.equity_curve, result.trades)
-    logger.info("Backtest metrics", metrics.__dict__)
+    symbols = args.symbol
+    # One MT5 session for all symbol lookups; the backtests themselves never touch MT5.
+    point_values = symbol_point_values(symbols)
+
+    point_args = [point_values[symbol] for symbol in symbols]
+    if len(symbols) == 1:
+        # A single symbol runs in-process; a worker would only add spawn and re-import cost.
+        results = list(map(run_symbol, symbols, repeat(config), repeat(args.initial_balance), point_args))
+    else:
+        # Each symbol is independent, so fan out across processes.
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(symbols))) as executor:
+            results = list(executor.map(run_symbol, symbols, repeat(config), repeat(args.initial_balance), point_args))
+
+    for symbol, metrics in zip(symbols, results):
+        logger.info("Backtest metrics", {"symbol": symbol, **metrics})
 
 
 if __name__ == "__main__":
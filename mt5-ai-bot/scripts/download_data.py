@@ -10,29 +10,55 @@ sys.path.insert(0, str(ROOT_DIR))
 
 
 import argparse
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 import MetaTrader5 as mt5
-import pandas as pd
+import numpy as np
 
 from src.config import load_config
-from src.data.storage import save_parquet
-from src.execution.mt5_adapter import MT5Adapter
+from src.data.storage import rates_to_frame, save_parquet
+from src.execution.mt5_adapter import TIMEFRAME_MAP, MT5Adapter
 from src.utils.logging import configure_logging, get_logger
 
 
 logger = get_logger(__name__)
 
 
-TIMEFRAME_MAP = {
-    "M1": mt5.TIMEFRAME_M1,
-    "M5": mt5.TIMEFRAME_M5,
-    "M15": mt5.TIMEFRAME_M15,
-    "M30": mt5.TIMEFRAME_M30,
-    "H1": mt5.TIMEFRAME_H1,
-    "H4": mt5.TIMEFRAME_H4,
-    "D1": mt5.TIMEFRAME_D1,
-}
+BARS_PER_DAY = {"M1": 1440, "M5": 288, "M15": 96, "M30": 48, "H1": 24, "H4": 6, "D1": 1}
+# Upper bound on bars per copy_rates_range call; very long ranges are fetched in pieces
+# so a single request never runs into the terminal's history limits.
+BATCH_BARS = 100_000
+# MT5 requests are serialised by the terminal anyway; workers overlap on frame building
+# and parquet writes.
+MT5_LOCK = threading.Lock()
+
+
+def download_symbol(symbol: str, timeframe: int, start: datetime, end: datetime, batch: timedelta, out_path: str) -> None:
+    chunks = []
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + batch, end)
+        # last_error() is terminal-global, so it is read under the same lock as the call
+        # it belongs to; otherwise another worker's request could overwrite it first.
+        with MT5_LOCK:
+            rates = mt5.copy_rates_range(symbol, timeframe, chunk_start, chunk_end)
+            error = mt5.last_error() if rates is None else None
+        if rates is None:
+            logger.error("Failed to download rates", {"symbol": symbol, "start": chunk_start.isoformat(), "error": error})
+            return
+        # Both range ends are inclusive, so a bar on the boundary comes back twice.
+        if chunks and len(rates):
+            rates = rates[rates["time"] > chunks[-1]["time"][-1]]
+        if len(rates):
+            chunks.append(rates)
+        chunk_start = chunk_end
+    if not chunks:
+        logger.warning("No rates in range", {"symbol": symbol})
+        return
+    save_parquet(rates_to_frame(np.concatenate(chunks)), out_path)
+    logger.info("Saved data", {"symbol": symbol, "path": out_path})
 
 
 def main() -> None:
@@ -52,17 +78,18 @@ def main() -> None:
     start = datetime.fromisoformat(args.start)
     end = datetime.fromisoformat(args.end)
 
-    for symbol in config.symbols:
-        timeframe = TIMEFRAME_MAP[config.timeframe]
-        rates = mt5.copy_rates_range(symbol, timeframe, start, end)
-        if rates is None:
-            logger.error("Failed to download rates", {"symbol": symbol})
-            continue
-        df = pd.DataFrame(rates)
-        df["time"] = pd.to_datetime(df["time"], unit="s", utc=True)
-        out_path = f"{config.data.output_dir}/{symbol}_{config.timeframe}.parquet"
-        save_parquet(df, out_path)
-        logger.info("Saved data", {"symbol": symbol, "path": out_path})
+    timeframe = TIMEFRAME_MAP[config.timeframe]
+    batch = timedelta(days=max(1, BATCH_BARS // BARS_PER_DAY[config.timeframe]))
+    symbols = config.symbols
+    out_paths = [f"{config.data.output_dir}/{symbol}_{config.timeframe}.parquet" for symbol in symbols]
+
+    # Symbols download concurrently: one worker waits on MT5 while others build and write frames.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(symbols)))) as executor:
+        list(executor.map(
+            lambda symbol, out_path: download_symbol(symbol, timeframe, start, end, batch, out_path),
+            symbols,
+            out_paths,
+        ))
 
     adapter.shutdown()
 
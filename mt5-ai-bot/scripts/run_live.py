@@ -14,44 +14,57 @@ import time
 from datetime import datetime, timezone
 
 import MetaTrader5 as mt5
-import pandas as pd
 from dotenv import load_dotenv
 
 from src.config import load_config
-from src.execution.mt5_adapter import MT5Adapter
+from src.data.rates_buffer import CLOSE, HIGH, LOW, RatesBuffer
+from src.execution.mt5_adapter import TIMEFRAME_MAP, MT5Adapter
 from src.execution.order_builder import build_market_order_request, build_sl_tp_request
 from src.execution.order_manager import OrderManager
 from src.execution.risk_manager import RiskLimits, RiskManager
-from src.execution.safeguards import kill_switch_active, is_symbol_tradable, spread_too_high, stops_level_ok
+from src.execution.safeguards import kill_switch_active, is_symbol_tradable, spread_too_high, stops_level_ok, symbol_constants
 from src.monitoring.alerts import load_telegram_alert
-from src.monitoring.journal import TradeJournal
-from src.strategy.atr_breakout import compute_signal
+from src.monitoring.journal import open_trade_journal
+from src.strategy.atr_breakout import compute_signal_arrays
+from src.strategy.donchian import DonchianWindow
 from src.utils.logging import configure_logging, get_logger
-from src.utils.timeutils import is_in_session, parse_sessions
+from src.utils.timeutils import compile_sessions, is_in_session, parse_sessions
 
 
 logger = get_logger(__name__)
 
-TIMEFRAME_MAP = {
-    "M1": mt5.TIMEFRAME_M1,
-    "M5": mt5.TIMEFRAME_M5,
-    "M15": mt5.TIMEFRAME_M15,
-    "M30": mt5.TIMEFRAME_M30,
-    "H1": mt5.TIMEFRAME_H1,
-    "H4": mt5.TIMEFRAME_H4,
-    "D1": mt5.TIMEFRAME_D1,
-}
 
+def refresh_rates(buffers: dict, symbol: str, timeframe: int, bars: int) -> RatesBuffer | None:
+    buffer = buffers.get(symbol)
+    latest = mt5.copy_rates_from_pos(symbol, timeframe, 0, 2)
+    if latest is None:
+        return None
+    if buffer is not None and buffer.update(latest):
+        return buffer
 
-def fetch_rates(symbol: str, timeframe: int, bars: int) -> pd.DataFrame:
     rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, bars)
-    if rates is None:
-        return pd.DataFrame()
-    df = pd.DataFrame(rates)
-    df["time"] = pd.to_datetime(df["time"], unit="s", utc=True)
-    df = df.set_index("time")
-    df = df.rename(columns={"open": "open", "high": "high", "low": "low", "close": "close", "tick_volume": "volume"})
-    return df
+    if rates is None or len(rates) == 0:
+        return None
+    buffer = RatesBuffer(bars)
+    buffer.reset(rates)
+    buffers[symbol] = buffer
+    return buffer
+
+
+def refresh_donchian(windows: dict, symbol: str, buffer: RatesBuffer, bars, breakout_N: int) -> DonchianWindow:
+    # The breakout range covers the closed bars before the forming one. Normally exactly one
+    # bar closed since the last call and is pushed; after a gap or resync the window is rebuilt.
+    times = buffer.times()
+    window = windows.get(symbol)
+    if window is None or len(times) < 3 or window.last_time != times[-3]:
+        window = DonchianWindow(breakout_N)
+        for high, low in bars[-(breakout_N + 1):-1][:, [HIGH, LOW]]:
+            window.push(high, low)
+        windows[symbol] = window
+    else:
+        window.push(bars[-2, HIGH], bars[-2, LOW])
+    window.last_time = int(times[-2]) if len(times) > 1 else None
+    return window
 
 
 def main() -> None:
@@ -71,8 +84,9 @@ def main() -> None:
     if not adapter.initialize():
         return
 
+    manager = OrderManager(adapter)
     alert = load_telegram_alert()
-    journal = TradeJournal(path="trades/trade_journal.csv")
+    journal = open_trade_journal("trades")
     risk_manager = RiskManager(
         limits=RiskLimits(
             risk_per_trade_pct=config.risk.risk_per_trade_pct,
@@ -83,78 +97,107 @@ def main() -> None:
     )
 
     tz, windows = parse_sessions(config.sessions.timezone, config.sessions.windows)
+    sessions = compile_sessions(windows)
     timeframe = TIMEFRAME_MAP[config.timeframe]
 
+    # Hoisted out of the polling loop; the config does not change while running.
+    symbols = config.symbols
+    breakout_N = config.strategy.breakout_N
+    atr_period = config.strategy.atr_period
+    atr_min = config.strategy.atr_min
+    ema_period = config.strategy.ema_period
+    use_trend_filter = config.strategy.use_trend_filter
+    sl_atr_mult = config.strategy.sl_atr_mult
+    rr_ratio = config.strategy.rr_ratio
+    max_spread_points = config.execution.max_spread_points
+    deviation = config.execution.deviation
+    kill_switch_file = config.execution.kill_switch_file
+    dry_run = args.dry_run or config.execution.dry_run
+    history_bars = max(breakout_N, atr_period, ema_period) + 5
+
     last_bar_time = {}
+    rate_buffers = {}
+    donchian_windows = {}
 
     try:
         while True:
             now = datetime.now(timezone.utc)
             risk_manager.reset_if_new_day(now)
 
-            if kill_switch_active(config.execution.kill_switch_file):
+            if kill_switch_active(kill_switch_file):
                 logger.warning("Kill switch active. No new trades.")
                 time.sleep(5)
                 continue
 
-            for symbol in config.symbols:
+            account = mt5.account_info()
+            if account is None:
+                logger.error("Account info not available", {"error": mt5.last_error()})
+                time.sleep(10)
+                continue
+            balance = account.balance
+
+            for symbol in symbols:
                 info = adapter.get_symbol_info(symbol)
                 if not is_symbol_tradable(info):
-                    logger.warning("Symbol not tradable", {"symbol": symbol})
+                    logger.warning("Symbol not tradable symbol=%s", symbol)
                     continue
 
-                tick = adapter.get_tick(symbol)
-                if tick is None:
+                # symbol_info already carries the current bid/ask, so no separate tick request.
+                if spread_too_high(info, max_spread_points, info.point):
+                    logger.warning("Spread too high symbol=%s", symbol)
                     continue
 
-                if spread_too_high(tick, config.execution.max_spread_points, info.point):
-                    logger.warning("Spread too high", {"symbol": symbol})
+                if not is_in_session(now, tz, sessions):
                     continue
 
-                if not is_in_session(now, tz, windows):
+                buffer = refresh_rates(rate_buffers, symbol, timeframe, history_bars)
+                if buffer is None:
                     continue
 
-                rates = fetch_rates(symbol, timeframe, max(config.strategy.breakout_N, config.strategy.atr_period, config.strategy.ema_period) + 5)
-                if rates.empty:
-                    continue
-
-                bar_time = rates.index[-1]
+                bar_time = buffer.last_time
                 if last_bar_time.get(symbol) == bar_time:
                     continue
                 last_bar_time[symbol] = bar_time
 
-                signal = compute_signal(
-                    rates,
-                    breakout_N=config.strategy.breakout_N,
-                    atr_period=config.strategy.atr_period,
-                    atr_min=config.strategy.atr_min,
-                    ema_period=config.strategy.ema_period,
-                    use_trend_filter=config.strategy.use_trend_filter,
+                bars = buffer.values()
+                donchian = refresh_donchian(donchian_windows, symbol, buffer, bars, breakout_N)
+                signal = compute_signal_arrays(
+                    bars[:, HIGH],
+                    bars[:, LOW],
+                    bars[:, CLOSE],
+                    breakout_N=breakout_N,
+                    atr_period=atr_period,
+                    atr_min=atr_min,
+                    ema_period=ema_period,
+                    use_trend_filter=use_trend_filter,
+                    donchian=donchian,
                 )
 
                 if signal.direction == 0:
                     continue
 
-                can_trade, reason = risk_manager.can_trade(balance=mt5.account_info().balance)
+                can_trade, reason = risk_manager.can_trade(balance=balance)
                 if not can_trade:
-                    logger.warning("Risk limits block trade", {"reason": reason})
+                    logger.warning("Risk limits block trade symbol=%s reason=%s", symbol, reason)
                     continue
 
-                sl_distance = config.strategy.sl_atr_mult * signal.atr_value
+                sl_distance = sl_atr_mult * signal.atr_value
                 if sl_distance <= 0:
                     continue
 
-                entry = tick.ask if signal.direction == 1 else tick.bid
-                sl = entry - sl_distance if signal.direction == 1 else entry + sl_distance
-                tp = entry + config.strategy.rr_ratio * sl_distance if signal.direction == 1 else entry - config.strategy.rr_ratio * sl_distance
+                direction = signal.direction
+                entry = info.ask if direction == 1 else info.bid
+                # direction is +1/-1, so SL/TP are placed by sign rather than branching per side.
+                sl = entry - sl_distance * direction
+                tp = entry + rr_ratio * sl_distance * direction
 
-                ok, min_dist = stops_level_ok(info, sl, tp, entry)
+                ok, min_dist = stops_level_ok(symbol_constants(info), sl, tp, entry)
                 if not ok:
-                    logger.warning("Stops too close", {"symbol": symbol, "min_distance": min_dist})
+                    logger.warning("Stops too close symbol=%s min_distance=%s", symbol, min_dist)
                     continue
 
                 volume = risk_manager.position_size_lots(
-                    balance=mt5.account_info().balance,
+                    balance=balance,
                     sl_distance=sl_distance,
                     point=info.point,
                     tick_value=info.trade_tick_value,
@@ -171,17 +214,19 @@ def main() -> None:
                     action=action,
                     volume=volume,
                     price=entry,
-                    deviation=config.execution.deviation,
+                    deviation=deviation,
                     sl=sl,
                     tp=tp,
                     symbol_info=info,
                 )
 
-                if args.dry_run or config.execution.dry_run:
-                    logger.info("DRY_RUN order", {"symbol": symbol, "direction": signal.direction, "volume": volume, "entry": entry, "sl": sl, "tp": tp})
+                if dry_run:
+                    logger.info(
+                        "DRY_RUN order symbol=%s direction=%s volume=%s entry=%s sl=%s tp=%s",
+                        symbol, signal.direction, volume, entry, sl, tp,
+                    )
                     continue
 
-                manager = OrderManager(adapter)
                 response = manager.send_order_with_fillings(order_req, info)
                 result = response.result
 
@@ -189,13 +234,13 @@ def main() -> None:
                     continue
 
                 if result.retcode == mt5.TRADE_RETCODE_INVALID_STOPS:
-                    logger.warning("Invalid stops, retry without SL/TP", {"symbol": symbol})
+                    logger.warning("Invalid stops, retry without SL/TP symbol=%s", symbol)
                     order_req = build_market_order_request(
                         symbol=symbol,
                         action=action,
                         volume=volume,
                         price=entry,
-                        deviation=config.execution.deviation,
+                        deviation=deviation,
                         sl=None,
                         tp=None,
                         symbol_info=info,
@@ -210,7 +255,7 @@ def main() -> None:
                 if result.retcode == mt5.TRADE_RETCODE_DONE:
                     journal.append(
                         {
-                            "time": datetime.now(timezone.utc).isoformat(),
+                            "time": now.isoformat(),
                             "symbol": symbol,
                             "direction": "BUY" if signal.direction == 1 else "SELL",
                             "volume": volume,
@@ -225,7 +270,12 @@ def main() -> None:
 
             time.sleep(10)
     finally:
-        adapter.shutdown()
+        # Each step runs even if an earlier one fails, so MT5 is always shut down.
+        for cleanup in (journal.close, alert.close, adapter.shutdown):
+            try:
+                cleanup()
+            except Exception:
+                logger.exception("Cleanup step failed", {"step": cleanup.__qualname__})
 
 
 if __name__ == "__main__":
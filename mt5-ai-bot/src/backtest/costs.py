@@ -14,3 +14,6 @@ class TradingCosts:
 
     def slippage_cost(self, point_value: float) -> float:
         return self.slippage_points * point_value
+
+    def exit_cost(self, point_value: float) -> float:
+        return (self.spread_points + self.slippage_points) * point_value
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from src.backtest.costs import TradingCosts
-from src.strategy.atr_breakout import compute_signal
-from src.utils.mathutils import atr
+from src.strategy.atr_breakout import precompute_signals
+from src.utils.jit import njit
 
 
 @dataclass
@@ -15,6 +16,153 @@ class BacktestResult:
     trades: pd.DataFrame
 
 
+@njit(cache=True)
+def _simulate(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    ema_arr: np.ndarray,
+    breakout_high: np.ndarray,
+    breakout_low: np.ndarray,
+    start: int,
+    atr_period: int,
+    initial_balance: float,
+    atr_min: float,
+    sl_atr_mult: float,
+    rr_ratio: float,
+    use_trend_filter: bool,
+    risk_fraction: float,
+    pnl_scale: float,
+    commission_per_lot: float,
+    exit_cost: float,
+):
+    n = len(close)
+    capacity = max(n - start, 0)
+    equity = np.empty(capacity)
+
+    # Closed trades are stored column-wise; at most one trade closes per simulated bar.
+    entry_idx = np.empty(capacity, dtype=np.int64)
+    exit_idx = np.empty(capacity, dtype=np.int64)
+    directions = np.empty(capacity, dtype=np.int8)
+    entries = np.empty(capacity)
+    exits = np.empty(capacity)
+    lots_col = np.empty(capacity)
+    pnls = np.empty(capacity)
+    r_multiples = np.empty(capacity)
+    n_trades = 0
+
+    balance = initial_balance
+    pos_active = False
+    pos_idx = 0
+    pos_dir = 0
+    pos_entry = 0.0
+    pos_sl = 0.0
+    pos_tp = 0.0
+    pos_lots = 0.0
+    pos_risk = 0.0
+
+    # ATR is a rolling mean of true range (same as mathutils.atr), kept as a window sum.
+    # Like rolling_mean_np, NaN true ranges are counted rather than summed and the sum is
+    # rebuilt once per window, so neither drift nor a single NaN bar outlives its window.
+    tr_window = np.zeros(atr_period)
+    tr_sum = 0.0
+    tr_nans = 0
+    atr_value = np.nan
+
+    for idx in range(n):
+        tr = high[idx] - low[idx]
+        if idx > 0:
+            tr = max(tr, abs(high[idx] - close[idx - 1]), abs(low[idx] - close[idx - 1]))
+        slot = idx % atr_period
+        expired = tr_window[slot]
+        if np.isnan(expired):
+            tr_nans -= 1
+        else:
+            tr_sum -= expired
+        if np.isnan(tr):
+            tr_nans += 1
+        else:
+            tr_sum += tr
+        tr_window[slot] = tr
+        if slot == atr_period - 1:
+            tr_sum = 0.0
+            for value in tr_window:
+                if not np.isnan(value):
+                    tr_sum += value
+        if idx >= atr_period - 1:
+            atr_value = tr_sum / atr_period if tr_nans == 0 else np.nan
+        if idx < start:
+            continue
+
+        if pos_active:
+            # Branchless exit test: SL wins over TP when both are touched in the same bar.
+            is_long = pos_dir == 1
+            is_short = not is_long
+            hit_sl = (is_long & (low[idx] <= pos_sl)) | (is_short & (high[idx] >= pos_sl))
+            hit_tp = (is_long & (high[idx] >= pos_tp)) | (is_short & (low[idx] <= pos_tp))
+
+            if hit_sl | hit_tp:
+                exit_price = pos_sl * hit_sl + pos_tp * (hit_tp > hit_sl)
+                pnl_value = ((exit_price - pos_entry) * pos_dir * pnl_scale - commission_per_lot) * pos_lots - exit_cost
+                balance += pnl_value
+                entry_idx[n_trades] = pos_idx
+                exit_idx[n_trades] = idx
+                directions[n_trades] = pos_dir
+                entries[n_trades] = pos_entry
+                exits[n_trades] = exit_price
+                lots_col[n_trades] = pos_lots
+                pnls[n_trades] = pnl_value
+                r_multiples[n_trades] = pnl_value / pos_risk
+                n_trades += 1
+                pos_active = False
+
+        equity[idx - start] = balance
+
+        # Fast path: no entry evaluation while in a trade or when ATR is below the
+        # filter (the comparison is also False for NaN during warm-up).
+        if pos_active or not (atr_value >= atr_min):
+            continue
+
+        entry = close[idx]
+        if entry > breakout_high[idx]:
+            direction = 1
+        elif entry < breakout_low[idx]:
+            direction = -1
+        else:
+            continue
+        if use_trend_filter:
+            ema_slope = ema_arr[idx] - ema_arr[idx - 1]
+            if direction == 1 and ema_slope <= 0:
+                continue
+            if direction == -1 and ema_slope >= 0:
+                continue
+
+        sl_distance = sl_atr_mult * atr_value
+        if sl_distance > 0:
+            risk_amount = balance * risk_fraction
+            lots = risk_amount / (sl_distance * pnl_scale)
+            pos_active = True
+            pos_idx = idx
+            pos_dir = direction
+            pos_entry = entry
+            pos_sl = entry - sl_distance * direction
+            pos_tp = entry + rr_ratio * sl_distance * direction
+            pos_lots = max(lots, 0.0)
+            pos_risk = risk_amount
+
+    return (
+        equity,
+        entry_idx[:n_trades],
+        exit_idx[:n_trades],
+        directions[:n_trades],
+        entries[:n_trades],
+        exits[:n_trades],
+        lots_col[:n_trades],
+        pnls[:n_trades],
+        r_multiples[:n_trades],
+    )
+
+
 def run_backtest(
     df: pd.DataFrame,
     initial_balance: float,
@@ -30,86 +178,41 @@ def run_backtest(
     tick_value: float,
     costs: TradingCosts,
 ) -> BacktestResult:
-    df = df.copy()
-    df["atr"] = atr(df, atr_period)
+    signals = precompute_signals(df, breakout_N=breakout_N, ema_period=ema_period)
+    start = max(breakout_N, atr_period, ema_period) + 1
 
-    balance = initial_balance
-    equity_curve = []
-    trades = []
-    position = None
-
-    for idx in range(max(breakout_N, atr_period, ema_period) + 1, len(df)):
-        row = df.iloc[idx]
-        timestamp = df.index[idx]
-
-        if position:
-            high = row["high"]
-            low = row["low"]
-            exit_price = None
-            if position["direction"] == 1:
-                if low <= position["sl"]:
-                    exit_price = position["sl"]
-                elif high >= position["tp"]:
-                    exit_price = position["tp"]
-            else:
-                if high >= position["sl"]:
-                    exit_price = position["sl"]
-                elif low <= position["tp"]:
-                    exit_price = position["tp"]
-
-            if exit_price is not None:
-                pnl = (exit_price - position["entry"]) * position["direction"]
-                pnl_value = pnl / point * tick_value * position["lots"]
-                pnl_value -= costs.commission_per_lot * position["lots"]
-                pnl_value -= costs.spread_cost(tick_value) + costs.slippage_cost(tick_value)
-                balance += pnl_value
-                trades.append(
-                    {
-                        "entry_time": position["time"],
-                        "exit_time": timestamp,
-                        "direction": position["direction"],
-                        "entry": position["entry"],
-                        "exit": exit_price,
-                        "lots": position["lots"],
-                        "pnl": pnl_value,
-                        "r_multiple": pnl_value / position["risk_amount"],
-                    }
-                )
-                position = None
-
-        if position is None:
-            subset = df.iloc[: idx + 1]
-            signal = compute_signal(
-                subset,
-                breakout_N=breakout_N,
-                atr_period=atr_period,
-                atr_min=atr_min,
-                ema_period=ema_period,
-                use_trend_filter=use_trend_filter,
-            )
-            if signal.direction != 0:
-                entry = row["close"]
-                atr_value = signal.atr_value
-                sl_distance = sl_atr_mult * atr_value
-                if sl_distance <= 0:
-                    equity_curve.append(balance)
-                    continue
-                sl = entry - sl_distance if signal.direction == 1 else entry + sl_distance
-                tp = entry + rr_ratio * sl_distance if signal.direction == 1 else entry - rr_ratio * sl_distance
-                risk_amount = balance * (risk_per_trade_pct / 100)
-                lots = risk_amount / (sl_distance / point * tick_value)
-                position = {
-                    "time": timestamp,
-                    "direction": signal.direction,
-                    "entry": entry,
-                    "sl": sl,
-                    "tp": tp,
-                    "lots": max(lots, 0),
-                    "risk_amount": risk_amount,
-                }
-
-        equity_curve.append(balance)
-
-    equity_series = pd.Series(equity_curve, index=df.index[max(breakout_N, atr_period, ema_period) + 1 :])
-    trades_df = pd.DataFrame(trades)
+    equity, entry_idx, exit_idx, directions, entries, exits, lots, pnls, r_multiples = _simulate(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        signals.ema,
+        signals.breakout_high,
+        signals.breakout_low,
+        start,
+        int(atr_period),
+        float(initial_balance),
+        float(atr_min),
+        float(sl_atr_mult),
+        float(rr_ratio),
+        bool(use_trend_filter),
+        risk_per_trade_pct / 100,
+        tick_value / point,
+        float(costs.commission_per_lot),
+        float(costs.exit_cost(tick_value)),
+    )
+
+    equity_series = pd.Series(equity, index=df.index[start:], copy=False)
+    trades_df = pd.DataFrame(
+        {
+            "entry_time": df.index.take(entry_idx),
+            "exit_time": df.index.take(exit_idx),
+            "direction": directions,
+            "entry": entries,
+            "exit": exits,
+            "lots": lots,
+            "pnl": pnls,
+            "r_multiple": r_multiples,
+        },
+        copy=False,
+    )
     return BacktestResult(equity_curve=equity_series, trades=trades_df)
@@ -17,28 +17,35 @@ class BacktestMetrics:
 
 
 def compute_metrics(equity_curve: pd.Series, trades: pd.DataFrame) -> BacktestMetrics:
-    returns = equity_curve.pct_change().dropna()
-    if returns.empty:
+    equity = equity_curve.to_numpy(dtype=np.float64)
+    if len(equity) < 2:
         return BacktestMetrics(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
-    cagr = (equity_curve.iloc[-1] / equity_curve.iloc[0]) ** (252 / len(returns)) - 1
-    running_max = equity_curve.cummax()
-    drawdown = (equity_curve - running_max) / running_max
-    max_drawdown = drawdown.min()
+    returns = equity[1:] / equity[:-1] - 1.0
+    returns = returns[~np.isnan(returns)]
+    if returns.size == 0:
+        return BacktestMetrics(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
-    profits = trades["pnl"].clip(lower=0).sum()
-    losses = trades["pnl"].clip(upper=0).abs().sum()
-    profit_factor = profits / losses if losses > 0 else float("inf")
+    cagr = (equity[-1] / equity[0]) ** (252 / returns.size) - 1
+    running_max = np.maximum.accumulate(equity)
+    max_drawdown = ((equity - running_max) / running_max).min()
 
-    sharpe = (returns.mean() / returns.std()) * np.sqrt(252) if returns.std() > 0 else 0.0
-    win_rate = (trades["pnl"] > 0).mean() if not trades.empty else 0.0
-    avg_r_multiple = trades["r_multiple"].mean() if not trades.empty else 0.0
+    std = returns.std(ddof=1) if returns.size > 1 else 0.0
+    sharpe = (returns.mean() / std) * np.sqrt(252) if std > 0 else 0.0
+
+    pnl = trades["pnl"].to_numpy(dtype=np.float64) if not trades.empty else np.empty(0)
+    wins = pnl > 0
+    profits = pnl[wins].sum()
+    losses = -pnl[pnl < 0].sum()
+    profit_factor = profits / losses if losses > 0 else float("inf")
+    win_rate = wins.mean() if pnl.size else 0.0
+    avg_r_multiple = trades["r_multiple"].to_numpy(dtype=np.float64).mean() if pnl.size else 0.0
 
     return BacktestMetrics(
-        cagr=cagr,
-        max_drawdown=max_drawdown,
-        profit_factor=profit_factor,
-        sharpe=sharpe,
-        win_rate=win_rate,
-        avg_r_multiple=avg_r_multiple,
+        cagr=float(cagr),
+        max_drawdown=float(max_drawdown),
+        profit_factor=float(profit_factor),
+        sharpe=float(sharpe),
+        win_rate=float(win_rate),
+        avg_r_multiple=float(avg_r_multiple),
     )
@@ -1,12 +1,69 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
+# Narrower integer types for the volume/spread columns written by download_data.
+INT_DOWNCASTS = {"tick_volume": "int32", "spread": "int16"}
+
+
+def _arrow_dtype(arrow_type):
+    # Keep timestamps on the NumPy datetime64 path so the index stays a DatetimeIndex.
+    import pyarrow as pa
+
+    if pa.types.is_timestamp(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _fits(column, dtype: str) -> bool:
+    # Columns with values outside the narrow type (e.g. huge crypto spreads) keep their width.
+    import pyarrow.compute as pc
+
+    bounds = pc.min_max(column)
+    low, high = bounds["min"].as_py(), bounds["max"].as_py()
+    if low is None:
+        return True
+    limits = np.iinfo(dtype)
+    return limits.min <= low and high <= limits.max
+
+
+def load_parquet(
+    path: str | Path,
+    tz: str,
+    columns: Optional[List[str]] = None,
+    row_groups: Optional[List[int]] = None,
+) -> pd.DataFrame:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet support requires 'pyarrow'. Install with 'pip install pyarrow' "
+            "or use Python 3.10–3.12 on Windows for prebuilt wheels."
+        ) from exc
+
+    # Memory-map the file so row groups are paged in from the OS cache.
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    if row_groups is None:
+        table = parquet_file.read(columns=columns)
+    else:
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+    for name, dtype in INT_DOWNCASTS.items():
+        if name in table.column_names and _fits(table[name], dtype):
+            position = table.schema.get_field_index(name)
+            table = table.set_column(position, name, table[name].cast(dtype))
+    # Arrow-backed columns skip the float64 block copy on conversion; the
+    # backtest engine pulls plain NumPy arrays out of them itself.
+    df = table.to_pandas(
+        self_destruct=True,
+        split_blocks=True,
+        use_threads=True,
+        types_mapper=_arrow_dtype,
+    )
 
-def load_parquet(path: str | Path, tz: str) -> pd.DataFrame:
-    df = pd.read_parquet(path)
     if "time" in df.columns:
         df["time"] = pd.to_datetime(df["time"], utc=True).dt.tz_convert(tz)
         df = df.set_index("time")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+FIELDS = ("open", "high", "low", "close", "tick_volume")
+COLUMNS = ("open", "high", "low", "close", "volume")
+HIGH, LOW, CLOSE = FIELDS.index("high"), FIELDS.index("low"), FIELDS.index("close")
+
+
+# Fixed-size ring buffer of the most recent bars returned by mt5.copy_rates_*.
+class RatesBuffer:
+    def __init__(self, size: int):
+        self.size = size
+        self._times = np.zeros(size, dtype=np.int64)
+        self._values = np.zeros((size, len(FIELDS)), dtype=np.float64)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_time(self) -> Optional[int]:
+        if self._count == 0:
+            return None
+        return int(self._times[(self._head - 1) % self.size])
+
+    def reset(self, rates: np.ndarray) -> None:
+        self._head = 0
+        self._count = 0
+        for bar in rates[-self.size:]:
+            self._append(bar)
+
+    def update(self, rates: np.ndarray) -> bool:
+        # Merge the latest few bars. Returns False when they do not overlap the
+        # buffer (missed bars), in which case the caller should reset() from history.
+        if self._count == 0 or len(rates) == 0 or int(rates[0]["time"]) > self.last_time:
+            return False
+        for bar in rates:
+            bar_time = int(bar["time"])
+            last_time = self.last_time
+            if bar_time > last_time:
+                self._append(bar)
+            elif bar_time == last_time:
+                self._write((self._head - 1) % self.size, bar)
+            elif self._count > 1 and bar_time == self._times[(self._head - 2) % self.size]:
+                self._write((self._head - 2) % self.size, bar)
+        return True
+
+    def values(self) -> np.ndarray:
+        # Bars in chronological order, one column per entry in FIELDS.
+        return self._values[self._order()]
+
+    def times(self) -> np.ndarray:
+        return self._times[self._order()]
+
+    def to_frame(self) -> pd.DataFrame:
+        order = self._order()
+        index = pd.to_datetime(self._times[order], unit="s", utc=True).rename("time")
+        return pd.DataFrame(self._values[order], index=index, columns=list(COLUMNS))
+
+    def _order(self) -> np.ndarray:
+        return (np.arange(self._count) + self._head - self._count) % self.size
+
+    def _append(self, bar) -> None:
+        self._write(self._head, bar)
+        self._head = (self._head + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def _write(self, slot: int, bar) -> None:
+        self._times[slot] = bar["time"]
+        for col, field in enumerate(FIELDS):
+            self._values[slot, col] = bar[field]
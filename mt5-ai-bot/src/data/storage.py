@@ -2,14 +2,39 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from src.data.loader import INT_DOWNCASTS
+
+
+def rates_to_frame(rates: np.ndarray) -> pd.DataFrame:
+    # Columns are the structured array's fields as-is; time is reinterpreted as
+    # datetime64[s] rather than parsed, so only the frame itself is allocated.
+    columns = {name: rates[name] for name in rates.dtype.names}
+    columns["time"] = pd.DatetimeIndex(rates["time"].astype("datetime64[s]", copy=False)).tz_localize("UTC")
+    # Store volume/spread narrow too, unless a value would not fit (e.g. huge crypto spreads).
+    for name, dtype in INT_DOWNCASTS.items():
+        column = columns.get(name)
+        if column is not None and len(column):
+            limits = np.iinfo(dtype)
+            if limits.min <= column.min() and column.max() <= limits.max:
+                columns[name] = column.astype(dtype)
+    return pd.DataFrame(columns, copy=False)
+
 
 def save_parquet(df: pd.DataFrame, path: str | Path) -> None:
     out = Path(path)
     out.parent.mkdir(parents=True, exist_ok=True)
     try:
-        df.to_parquet(out, index=False)
+        df.to_parquet(
+            out,
+            engine="pyarrow",
+            compression="zstd",
+            compression_level=3,
+            row_group_size=100_000,
+            index=False,
+        )
     except ImportError as exc:
         raise ImportError(
             "Parquet support requires 'pyarrow'. Install with 'pip install pyarrow' "
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
@@ -12,12 +13,23 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MT5Response:
     request: Dict[str, Any]
     result: Any
 
 
+TIMEFRAME_MAP = {
+    "M1": mt5.TIMEFRAME_M1,
+    "M5": mt5.TIMEFRAME_M5,
+    "M15": mt5.TIMEFRAME_M15,
+    "M30": mt5.TIMEFRAME_M30,
+    "H1": mt5.TIMEFRAME_H1,
+    "H4": mt5.TIMEFRAME_H4,
+    "D1": mt5.TIMEFRAME_D1,
+}
+
+
 RET_CODES = {
     mt5.TRADE_RETCODE_REQUOTE: "Requote",
     mt5.TRADE_RETCODE_REJECT: "Rejected",
@@ -48,19 +60,37 @@ RET_CODES = {
 
 
 class MT5Adapter:
+    # The MetaTrader5 module holds a single process-wide terminal connection, so adapters
+    # share it: only the first initialize() connects and only the last shutdown() closes.
+    _init_lock = threading.Lock()
+    _init_count = 0
+
     def __init__(self, retry_attempts: int, retry_backoff_seconds: int):
         self.retry_attempts = retry_attempts
         self.retry_backoff_seconds = retry_backoff_seconds
+        self._initialized = False
 
     def initialize(self) -> bool:
-        if not mt5.initialize():
-            logger.error("MT5 initialize failed", {"error": mt5.last_error()})
-            return False
+        if self._initialized:
+            return True
+        with MT5Adapter._init_lock:
+            if MT5Adapter._init_count == 0 and not mt5.initialize():
+                logger.error("MT5 initialize failed", {"error": mt5.last_error()})
+                return False
+            MT5Adapter._init_count += 1
+            self._initialized = True
         logger.info("MT5 initialized")
         return True
 
     def shutdown(self) -> None:
-        mt5.shutdown()
+        if not self._initialized:
+            return
+        with MT5Adapter._init_lock:
+            self._initialized = False
+            MT5Adapter._init_count -= 1
+            if MT5Adapter._init_count > 0:
+                return
+            mt5.shutdown()
         logger.info("MT5 shutdown")
 
     def get_symbol_info(self, symbol: str):
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 import MetaTrader5 as mt5
 
@@ -11,24 +13,45 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+# Copying a prebuilt dict and filling the per-order fields is cheaper than a fresh literal;
+# key order matches the request previously built inline.
+_DEAL_TEMPLATE: Dict[str, Any] = {
+    "action": mt5.TRADE_ACTION_DEAL,
+    "symbol": "",
+    "volume": 0.0,
+    "type": 0,
+    "price": 0.0,
+    "deviation": 0,
+    "magic": 0,
+    "comment": "",
+    "type_time": mt5.ORDER_TIME_GTC,
+    "type_filling": 0,
+}
+
+
+@dataclass(slots=True)
 class OrderRequest:
     request: Dict[str, Any]
     filling_mode: int
 
 
 def allowed_fillings(symbol_info) -> List[int]:
+    return list(_allowed_fillings(getattr(symbol_info, "filling_modes", 0), symbol_info.filling_mode))
+
+
+@lru_cache(maxsize=512)
+def _allowed_fillings(bitmask: int, default: int) -> Tuple[int, ...]:
+    # Filling modes are fixed per symbol for the session, so each (bitmask, default) pair is resolved once.
     modes = []
-    bitmask = getattr(symbol_info, "filling_modes", 0)
     for mode in [mt5.ORDER_FILLING_FOK, mt5.ORDER_FILLING_IOC, mt5.ORDER_FILLING_RETURN]:
         if bitmask == 0:
-            modes.append(symbol_info.filling_mode)
+            modes.append(default)
             break
         if bitmask & mode:
             modes.append(mode)
     if not modes:
-        modes.append(symbol_info.filling_mode)
-    return list(dict.fromkeys(modes))
+        modes.append(default)
+    return tuple(dict.fromkeys(modes))
 
 
 def build_market_order_request(
@@ -46,25 +69,23 @@ def build_market_order_request(
     fillings = allowed_fillings(symbol_info)
     filling_mode = fillings[0]
 
-    request = {
-        "action": mt5.TRADE_ACTION_DEAL,
-        "symbol": symbol,
-        "volume": volume,
-        "type": action,
-        "price": price,
-        "deviation": deviation,
-        "magic": magic,
-        "comment": comment,
-        "type_time": mt5.ORDER_TIME_GTC,
-        "type_filling": filling_mode,
-    }
+    request = _DEAL_TEMPLATE.copy()
+    request["symbol"] = symbol
+    request["volume"] = volume
+    request["type"] = action
+    request["price"] = price
+    request["deviation"] = deviation
+    request["magic"] = magic
+    request["comment"] = comment
+    request["type_filling"] = filling_mode
 
     if sl is not None:
         request["sl"] = sl
     if tp is not None:
         request["tp"] = tp
 
-    logger.info("Built order request", {"request": request})
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Built order request", {"request": request})
     return OrderRequest(request=request, filling_mode=filling_mode)
 
 
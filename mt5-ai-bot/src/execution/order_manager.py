@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import Any, Dict, List, Optional
 
 import MetaTrader5 as mt5
@@ -17,20 +18,17 @@ class OrderManager:
         self.mt5_adapter = mt5_adapter
 
     def send_order_with_fillings(self, order_request: OrderRequest, symbol_info) -> Any:
-        fillings = allowed_fillings(symbol_info)
-        for filling in fillings:
-            request = dict(order_request.request)
+        response = None
+        # The request dict is updated in place; after the call it records the filling actually used.
+        request = order_request.request
+        for filling in allowed_fillings(symbol_info):
             request["type_filling"] = filling
+            order_request.filling_mode = filling
             response = self.mt5_adapter.place_market_order(request)
-            if response.result is None:
+            # Only an invalid filling is worth another attempt; anything else is final.
+            if response.result is None or response.result.retcode != mt5.TRADE_RETCODE_INVALID_FILL:
                 return response
-            if response.result.retcode == mt5.TRADE_RETCODE_DONE:
-                return response
-            if response.result.retcode == mt5.TRADE_RETCODE_INVALID_FILL:
+            if logger.isEnabledFor(logging.WARNING):
                 logger.warning("Invalid filling mode, retrying", {"filling": filling})
-                continue
-            if response.result.retcode == mt5.TRADE_RETCODE_DONE:
-                return response
-            return response
         logger.error("All filling modes failed", {"symbol": symbol_info.name})
-        return self.mt5_adapter.place_market_order(order_request.request)
+        return response
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class RiskLimits:
     risk_per_trade_pct: float
     daily_loss_limit_pct: float
@@ -12,22 +14,32 @@ class RiskLimits:
     max_concurrent_positions_per_symbol: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskState:
-    day: str = ""
+    day_ordinal: int = 0
     trades_today: int = 0
     realized_pnl_today: float = 0.0
 
+    @property
+    def day(self) -> str:
+        return date.fromordinal(self.day_ordinal).isoformat() if self.day_ordinal else ""
+
 
-@dataclass
+@dataclass(slots=True)
 class RiskManager:
     limits: RiskLimits
     state: RiskState = field(default_factory=RiskState)
+    _daily_loss_limit_frac: float = field(default=0.0, init=False)
+    _risk_frac: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        self._daily_loss_limit_frac = -(self.limits.daily_loss_limit_pct / 100)
+        self._risk_frac = self.limits.risk_per_trade_pct / 100
 
     def reset_if_new_day(self, now: datetime) -> None:
-        day = now.strftime("%Y-%m-%d")
-        if day != self.state.day:
-            self.state.day = day
+        day_ordinal = now.toordinal()
+        if day_ordinal != self.state.day_ordinal:
+            self.state.day_ordinal = day_ordinal
             self.state.trades_today = 0
             self.state.realized_pnl_today = 0.0
 
@@ -35,10 +47,15 @@ class RiskManager:
         self.state.trades_today += 1
         self.state.realized_pnl_today += pnl
 
+    def record_trades_bulk(self, pnls) -> None:
+        pnls = np.asarray(pnls, dtype=np.float64)
+        self.state.trades_today += pnls.size
+        self.state.realized_pnl_today += float(pnls.sum())
+
     def can_trade(self, balance: float) -> tuple[bool, str]:
         if self.state.trades_today >= self.limits.max_trades_per_day:
             return False, "max_trades_per_day"
-        daily_loss_limit = -balance * (self.limits.daily_loss_limit_pct / 100)
+        daily_loss_limit = balance * self._daily_loss_limit_frac
         if self.state.realized_pnl_today <= daily_loss_limit:
             return False, "daily_loss_limit"
         return True, "ok"
@@ -53,9 +70,33 @@ class RiskManager:
         volume_min: float,
         volume_max: float,
     ) -> float:
-        risk_amount = balance * (self.limits.risk_per_trade_pct / 100)
+        risk_amount = balance * self._risk_frac
         if sl_distance <= 0 or point <= 0 or tick_value <= 0:
             return 0.0
         raw_lots = risk_amount / (sl_distance / point * tick_value)
         rounded = round(raw_lots / volume_step) * volume_step
         return min(max(rounded, volume_min), volume_max)
+
+    def position_size_lots_batch(
+        self,
+        balance: float,
+        sl_distance,
+        point,
+        tick_value,
+        volume_step,
+        volume_min,
+        volume_max,
+    ) -> np.ndarray:
+        # Vectorised position_size_lots: arguments broadcast against each other, same rounding
+        # (half-to-even on volume_step multiples) and clamping, 0.0 where sizing is impossible.
+        sl_distance = np.asarray(sl_distance, dtype=np.float64)
+        point = np.asarray(point, dtype=np.float64)
+        tick_value = np.asarray(tick_value, dtype=np.float64)
+        volume_step = np.asarray(volume_step, dtype=np.float64)
+        risk_amount = balance * self._risk_frac
+        valid = (sl_distance > 0) & (point > 0) & (tick_value > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw_lots = risk_amount / (sl_distance / point * tick_value)
+        rounded = np.round(raw_lots / volume_step) * volume_step
+        lots = np.minimum(np.maximum(rounded, volume_min), volume_max)
+        return np.where(valid, lots, 0.0)
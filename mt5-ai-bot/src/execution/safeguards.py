@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 from src.utils.logging import get_logger
@@ -10,25 +12,41 @@ logger = get_logger(__name__)
 
 
 def kill_switch_active(path: str) -> bool:
-    return Path(path).exists()
+    return os.path.exists(path)
 
 
 def is_symbol_tradable(symbol_info) -> bool:
     return bool(symbol_info and symbol_info.visible and symbol_info.trade_mode == 0)
 
 
-def spread_too_high(tick, max_spread_points: int, point: float) -> bool:
-    if tick is None:
+def spread_too_high(quote, max_spread_points: int, point: float) -> bool:
+    # quote is anything with bid/ask: a tick or the symbol_info itself.
+    if quote is None:
         return True
-    spread = (tick.ask - tick.bid) / point
+    spread = (quote.ask - quote.bid) / point
     return spread > max_spread_points
 
 
-def stops_level_ok(symbol_info, sl: float, tp: float, price: float) -> Tuple[bool, float]:
-    if symbol_info is None:
+@dataclass(frozen=True, slots=True)
+class SymbolConstants:
+    point: float
+    min_distance: float
+
+
+def symbol_constants(symbol_info) -> SymbolConstants:
+    return _symbol_constants(symbol_info.point, symbol_info.stops_level)
+
+
+@lru_cache(maxsize=512)
+def _symbol_constants(point: float, stops_level: int) -> SymbolConstants:
+    # Stop levels only change with the symbol spec, so each spec is resolved once.
+    return SymbolConstants(point=point, min_distance=stops_level * point * 1.2)
+
+
+def stops_level_ok(constants: SymbolConstants | None, sl: float, tp: float, price: float) -> Tuple[bool, float]:
+    if constants is None:
         return False, 0.0
-    stops_level = symbol_info.stops_level * symbol_info.point
-    min_distance = stops_level * 1.2
+    min_distance = constants.min_distance
     if sl is not None and abs(price - sl) < min_distance:
         return False, min_distance
     if tp is not None and abs(price - tp) < min_distance:
@@ -1,36 +1,125 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.utils.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+_STOP = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class TelegramAlert:
     token: Optional[str]
     chat_id: Optional[str]
+    max_queue: int = 100
+    max_batch: int = 10
+    retry_attempts: int = 3
+    retry_backoff_seconds: float = 1.0
+    dropped: int = field(default=0, init=False)
+    _queue: queue.Queue = field(init=False)
+    _worker: Optional[threading.Thread] = field(default=None, init=False)
+    _session: requests.Session = field(init=False)
+    _url: str = field(default="", init=False)
+
+    def __post_init__(self) -> None:
+        self._queue = queue.Queue(maxsize=self.max_queue)
+        self._url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        # Keep-alive session; connection errors and 429/5xx responses are retried with
+        # exponential backoff. Read errors are not, since the message may already be delivered.
+        retry = Retry(
+            total=max(self.retry_attempts - 1, 0),
+            read=0,
+            backoff_factor=self.retry_backoff_seconds,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token and self.chat_id)
+
+    def start(self) -> None:
+        if not self.enabled or self._worker is not None:
+            return
+        self._worker = threading.Thread(target=self._run, name="telegram-alerts", daemon=True)
+        self._worker.start()
 
     def send(self, message: str) -> None:
-        if not self.token or not self.chat_id:
+        # Only enqueues; delivery happens on the worker thread so trading never waits on HTTP.
+        if not self.enabled:
             return
-        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
-        payload = {"chat_id": self.chat_id, "text": message}
+        self.start()
+        self._put(message)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._worker is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Telegram alert queue did not drain before shutdown", {"pending": self._queue.qsize()})
+        else:
+            self._worker.join(timeout)
+        self._worker = None
+
+    def _put(self, item) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                # Drop the oldest alert so a burst cannot grow the queue without bound.
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self.dropped += 1
+                logger.warning("Telegram alert queue full, dropped oldest", {"dropped": self.dropped})
+
+    def _run(self) -> None:
+        while True:
+            messages: List[str] = []
+            item = self._queue.get()
+            while item is not _STOP:
+                messages.append(item)
+                if len(messages) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if messages:
+                self._post("\n".join(messages))
+            if item is _STOP:
+                return
+
+    def _post(self, text: str) -> None:
+        payload = {"chat_id": self.chat_id, "text": text}
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._session.post(self._url, json=payload, timeout=(3.05, 10))
             response.raise_for_status()
         except requests.RequestException as exc:
             logger.error("Telegram alert failed", {"error": str(exc)})
 
 
 def load_telegram_alert() -> TelegramAlert:
-    return TelegramAlert(
+    alert = TelegramAlert(
         token=os.getenv("TELEGRAM_TOKEN"),
         chat_id=os.getenv("TELEGRAM_CHAT_ID"),
     )
+    alert.start()
+    return alert
@@ -1,33 +1,148 @@
 from __future__ import annotations
 
-import csv
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, TextIO
 
+from src.utils.logging import get_logger
 
-@dataclass
+
+logger = get_logger(__name__)
+
+
+FIELDS = ("time", "symbol", "direction", "volume", "price", "sl", "tp", "ticket", "comment")
+HEADER = ",".join(FIELDS) + "\r\n"
+
+
+@dataclass(slots=True)
 class TradeJournal:
     path: Path
+    flush_every: int = 1
+    fsync_on_flush: bool = False
+    _file: Optional[TextIO] = field(default=None, init=False)
+    _pending: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
+        self.path = Path(self.path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.path.exists():
-            with self.path.open("w", newline="") as file:
-                writer = csv.DictWriter(file, fieldnames=[
-                    "time",
-                    "symbol",
-                    "direction",
-                    "volume",
-                    "price",
-                    "sl",
-                    "tp",
-                    "ticket",
-                    "comment",
-                ])
-                writer.writeheader()
+        write_header = not self.path.exists()
+        # One long-lived handle with a 64KB buffer instead of open/write/close per row.
+        self._file = self.path.open("a", newline="", buffering=65536)
+        if write_header:
+            self._file.write(HEADER)
+            self._file.flush()
 
     def append(self, row: Dict[str, str | float | int]) -> None:
-        with self.path.open("a", newline="") as file:
-            writer = csv.DictWriter(file, fieldnames=row.keys())
-            writer.writerow(row)
+        # Same output as csv.DictWriter for the fixed journal columns, without its per-row dispatch.
+        self._file.write(",".join([_csv_field(row.get(name, "")) for name in FIELDS]) + "\r\n")
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._file is None or not self._pending:
+            return
+        self._file.flush()
+        if self.fsync_on_flush:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> TradeJournal:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _csv_field(value) -> str:
+    if value is None:
+        return ""
+    text = str(value)
+    if any(char in text for char in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+@dataclass
+class FeatherTradeJournal:
+    directory: Path
+    flush_every: int = 1
+    _day: str = field(default="", init=False)
+    _rows: List[Dict[str, str | float | int]] = field(default_factory=list, init=False)
+    _pending: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        # Fail at construction rather than on the first fill, after the order went out.
+        _import_feather()
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, day: str) -> Path:
+        return self.directory / f"trade_journal_{day}.feather"
+
+    def append(self, row: Dict[str, str | float | int]) -> None:
+        day = str(row["time"])[:10]
+        if day != self._day:
+            self.flush()
+            self._day = day
+            self._rows = self._read_day(day)
+        self._rows.append(row)
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        # Feather files cannot be appended to, so the whole day file is rewritten: with the
+        # default flush_every=1 a day of n fills costs O(n^2) row writes. n is capped by
+        # max_trades_per_day, and flushing per fill keeps every fill durable; raise
+        # flush_every for high-volume use.
+        # It goes to a temp file first and is swapped in atomically, so an interrupted
+        # write never leaves a truncated journal behind.
+        if not self._pending:
+            return
+        pa, feather = _import_feather()
+        path = self.path_for(self._day)
+        tmp_path = path.with_name(path.name + ".tmp")
+        feather.write_feather(pa.Table.from_pylist(self._rows), tmp_path, compression="lz4")
+        os.replace(tmp_path, path)
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+
+    def _read_day(self, day: str) -> List[Dict[str, str | float | int]]:
+        path = self.path_for(day)
+        if not path.exists():
+            return []
+        _, feather = _import_feather()
+        return feather.read_table(path).to_pylist()
+
+
+def open_trade_journal(directory: str | Path):
+    # Daily Feather files when pyarrow is available, otherwise the CSV journal.
+    try:
+        return FeatherTradeJournal(directory=directory)
+    except ImportError:
+        path = Path(directory) / "trade_journal.csv"
+        logger.warning("pyarrow not installed, journaling to CSV", {"path": str(path)})
+        return TradeJournal(path=path)
+
+
+def _import_feather():
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError as exc:
+        raise ImportError(
+            "Feather journals require 'pyarrow'. Install with 'pip install pyarrow' "
+            "or use Python 3.10–3.12 on Windows for prebuilt wheels."
+        ) from exc
+    return pa, feather
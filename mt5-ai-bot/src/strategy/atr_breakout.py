@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from src.utils.mathutils import atr, ema
+from src.strategy.donchian import DonchianWindow
+from src.utils.mathutils import ema_np, rolling_max_np, rolling_min_np
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     direction: int  # 1 buy, -1 sell, 0 none
     atr_value: float
@@ -16,30 +19,58 @@ class Signal:
     ema_slope: float
 
 
+@dataclass
+class SignalArrays:
+    breakout_high: np.ndarray
+    breakout_low: np.ndarray
+    ema: np.ndarray
+
+
 def compute_signal(df: pd.DataFrame, breakout_N: int, atr_period: int, atr_min: float, ema_period: int,
                    use_trend_filter: bool) -> Signal:
-    if len(df) < max(breakout_N, atr_period, ema_period) + 1:
-        return Signal(0, 0.0, 0.0, 0.0, 0.0)
+    return compute_signal_arrays(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        breakout_N=breakout_N,
+        atr_period=atr_period,
+        atr_min=atr_min,
+        ema_period=ema_period,
+        use_trend_filter=use_trend_filter,
+    )
 
-    df = df.copy()
-    df["atr"] = atr(df, atr_period)
-    df["ema"] = ema(df["close"], ema_period)
 
-    recent = df.iloc[-1]
-    prior = df.iloc[-(breakout_N + 1):-1]
-    breakout_high = prior["high"].max()
-    breakout_low = prior["low"].min()
-    atr_value = float(recent["atr"])
-    ema_slope = float(df["ema"].iloc[-1] - df["ema"].iloc[-2])
+def compute_signal_arrays(high: np.ndarray, low: np.ndarray, close: np.ndarray, breakout_N: int, atr_period: int,
+                          atr_min: float, ema_period: int, use_trend_filter: bool,
+                          donchian: Optional[DonchianWindow] = None) -> Signal:
+    # donchian, when given, must hold the breakout_N bars before the last one.
+    if len(close) < max(breakout_N, atr_period, ema_period) + 1:
+        return Signal(0, 0.0, 0.0, 0.0, 0.0)
 
-    if pd.isna(atr_value) or atr_value < atr_min:
-        return Signal(0, atr_value, breakout_high, breakout_low, ema_slope)
+    # Cheapest filter first: most bars fail the ATR check, so skip the breakout range and EMA for them.
+    h = high[-atr_period:]
+    l = low[-atr_period:]
+    prev_close = close[-(atr_period + 1):-1]
+    tr = np.maximum(np.maximum(h - l, np.abs(h - prev_close)), np.abs(l - prev_close))
+    atr_value = float(tr.mean())
+    if not atr_value >= atr_min:
+        return Signal(0, atr_value, 0.0, 0.0, 0.0)
 
-    close = float(recent["close"])
+    if donchian is not None:
+        breakout_high = float(donchian.current_high())
+        breakout_low = float(donchian.current_low())
+    else:
+        breakout_high = float(high[-(breakout_N + 1):-1].max())
+        breakout_low = float(low[-(breakout_N + 1):-1].min())
+    # The EMA runs over the whole window.
+    ema_values = ema_np(close, ema_period)
+    ema_slope = float(ema_values[-1] - ema_values[-2])
+
+    last_close = float(close[-1])
     direction = 0
-    if close > breakout_high:
+    if last_close > breakout_high:
         direction = 1
-    elif close < breakout_low:
+    elif last_close < breakout_low:
         direction = -1
 
     if use_trend_filter and direction != 0:
@@ -49,3 +80,23 @@ def compute_signal(df: pd.DataFrame, breakout_N: int, atr_period: int, atr_min:
             direction = 0
 
     return Signal(direction, atr_value, breakout_high, breakout_low, ema_slope)
+
+
+def precompute_signals(df: pd.DataFrame, breakout_N: int, ema_period: int) -> SignalArrays:
+    # Value at bar i matches what compute_signal(df.iloc[: i + 1]) would see.
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    return SignalArrays(
+        breakout_high=_shift(rolling_max_np(high, breakout_N)),
+        breakout_low=_shift(rolling_min_np(low, breakout_N)),
+        ema=ema_np(df["close"].to_numpy(dtype=np.float64), ema_period),
+    )
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    # Bar i uses the range of the bars before it.
+    shifted = np.empty_like(values)
+    if len(values):
+        shifted[0] = np.nan
+        shifted[1:] = values[:-1]
+    return shifted
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+
+# Highest high / lowest low of the last `size` pushed bars, kept in monotonic deques so
+# each push is amortised O(1) and the bounds are read from the front.
+class DonchianWindow:
+    def __init__(self, size: int):
+        self.size = size
+        self.last_time: Optional[int] = None
+        self._highs: Deque[Tuple[int, float]] = deque()
+        self._lows: Deque[Tuple[int, float]] = deque()
+        self._pushed = 0
+
+    def __len__(self) -> int:
+        return min(self._pushed, self.size)
+
+    def push(self, high: float, low: float) -> None:
+        idx = self._pushed
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((idx, high))
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((idx, low))
+
+        oldest = idx - self.size + 1
+        if self._highs[0][0] < oldest:
+            self._highs.popleft()
+        if self._lows[0][0] < oldest:
+            self._lows.popleft()
+        self._pushed += 1
+
+    def current_high(self) -> float:
+        return self._highs[0][1]
+
+    def current_low(self) -> float:
+        return self._lows[0][1]
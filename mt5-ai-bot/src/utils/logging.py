@@ -1,16 +1,63 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
-from datetime import datetime, timezone
+import math
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib fallback produces the same payloads, just slower
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    # Non-finite floats are written as the strings "NaN"/"Infinity"/"-Infinity" on both paths
+    # (orjson would silently write null). Payloads are only walked when one may be present:
+    # orjson output containing null, or json.dumps rejecting the payload.
+    if orjson is None:
+        try:
+            return json.dumps(payload, separators=(",", ":"), allow_nan=False)
+        except ValueError:
+            return json.dumps(_non_finite_as_str(payload), separators=(",", ":"))
+    encoded = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+    if b"null" in encoded:
+        encoded = orjson.dumps(_non_finite_as_str(payload), option=_ORJSON_OPTIONS)
+    return encoded.decode()
+
+
+_NON_FINITE = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+
+def _non_finite_as_str(value: Any) -> Any:
+    if isinstance(value, (float, np.floating)):
+        return value if math.isfinite(value) else _NON_FINITE[repr(float(value))]
+    if isinstance(value, dict):
+        return {key: _non_finite_as_str(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_non_finite_as_str(item) for item in value]
+    if isinstance(value, np.ndarray) and value.dtype.kind == "f" and not np.isfinite(value).all():
+        return _non_finite_as_str(value.tolist())
+    return value
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
+        # record.created is already captured by logging; format it without building a datetime.
+        created = record.created
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(created))
         payload: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": f"{timestamp}.{int(created % 1 * 1e6):06d}+00:00",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -19,10 +66,68 @@ class JsonFormatter(logging.Formatter):
             payload.update(record.args)
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload)
+        return _dumps(payload)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    # Writes go through a 64KB buffer and are only flushed for ERROR and above (or when the
+    # buffer fills / the handler closes), instead of one write syscall per record.
+    # The base shouldRollover() formats the record and seeks the stream, which flushes the
+    # buffer every time, so rollover is decided from a running size count instead.
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, buffering=65536)
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # Characters stand in for bytes; the JSON lines are (almost always) ASCII.
+            if self.maxBytes > 0 and self._size > 0 and self._size + len(msg) > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _RecordQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Keep the record (the default prepare() formats it and drops the dict args that
+        # JsonFormatter merges into the payload), but snapshot those args: they are
+        # serialised later on the listener thread, and callers may mutate them meanwhile
+        # (e.g. the order request's type_filling). One shallow level covers the dict/list
+        # values callers pass; a deepcopy would cost more than the record itself.
+        args = record.args
+        if isinstance(args, dict):
+            record.args = {key: value.copy() if isinstance(value, (dict, list)) else value for key, value in args.items()}
+        return record
+
+
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def configure_logging(log_dir: str | Path = "logs", level: int = logging.INFO) -> None:
+    global _listener
+
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
     log_file = log_path / "bot.log"
@@ -32,15 +137,19 @@ def configure_logging(log_dir: str | Path = "logs", level: int = logging.INFO) -
     root = logging.getLogger()
     root.setLevel(level)
     root.handlers.clear()
+    _stop_listener()
 
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
 
-    file_handler = logging.FileHandler(log_file)
+    file_handler = BufferedRotatingFileHandler(log_file, maxBytes=64 * 1024 * 1024, backupCount=5)
     file_handler.setFormatter(formatter)
 
-    root.addHandler(stream_handler)
-    root.addHandler(file_handler)
+    # Callers only enqueue records; formatting and I/O run on the listener thread.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(_RecordQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+    _listener.start()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -1,19 +1,126 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from src.utils.jit import njit
+
 
 def atr(df: pd.DataFrame, period: int) -> pd.Series:
-    high = df["high"]
-    low = df["low"]
-    close = df["close"].shift(1)
-    tr = pd.concat([
-        (high - low),
-        (high - close).abs(),
-        (low - close).abs(),
-    ], axis=1).max(axis=1)
-    return tr.rolling(window=period, min_periods=period).mean()
+    values = atr_np(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        period,
+    )
+    return pd.Series(values, index=df.index, copy=False)
 
 
 def ema(series: pd.Series, period: int) -> pd.Series:
-    return series.ewm(span=period, adjust=False).mean()
+    values = ema_np(series.to_numpy(dtype=np.float64), period)
+    return pd.Series(values, index=series.index, name=series.name, copy=False)
+
+
+def atr_np(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    # Rolling mean of true range; the first bar has no previous close, so its range is high - low.
+    prev_close = np.empty_like(close)
+    if len(close):
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+    # Two scratch buffers reused through out= instead of five full-length temporaries.
+    tr = np.subtract(high, low)
+    scratch = np.subtract(high, prev_close)
+    np.abs(scratch, out=scratch)
+    np.fmax(tr, scratch, out=tr)
+    np.subtract(low, prev_close, out=scratch)
+    np.abs(scratch, out=scratch)
+    np.fmax(tr, scratch, out=tr)
+
+    return rolling_mean_np(tr, period)
+
+
+@njit(cache=True)
+def rolling_mean_np(values: np.ndarray, window: int) -> np.ndarray:
+    # O(n) running window sum; like rolling(window).mean(), NaN while the window holds a NaN.
+    # The sum is rebuilt from scratch once per window so rounding error cannot accumulate.
+    n = len(values)
+    out = np.full(n, np.nan)
+    total = 0.0
+    nan_count = 0
+    for idx in range(n):
+        value = values[idx]
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            total += value
+        if idx >= window:
+            old = values[idx - window]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                total -= old
+        if idx % window == window - 1:
+            total = 0.0
+            for offset in range(idx - window + 1, idx + 1):
+                if not np.isnan(values[offset]):
+                    total += values[offset]
+        if idx >= window - 1 and nan_count == 0:
+            out[idx] = total / window
+    return out
+
+
+@njit(cache=True)
+def ema_np(values: np.ndarray, period: int) -> np.ndarray:
+    # Same recurrence as ewm(span=period, adjust=False).
+    alpha = 2.0 / (period + 1.0)
+    decay = 1.0 - alpha
+    out = np.empty(len(values))
+    if len(values) == 0:
+        return out
+    value = values[0]
+    out[0] = value
+    for idx in range(1, len(values)):
+        value = decay * value + alpha * values[idx]
+        out[idx] = value
+    return out
+
+
+def rolling_max_np(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_extreme(values, window, True)
+
+
+def rolling_min_np(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_extreme(values, window, False)
+
+
+@njit(cache=True)
+def _rolling_extreme(values: np.ndarray, window: int, is_max: bool) -> np.ndarray:
+    # Monotonic deque of indices kept in a ring buffer: one pass, amortised O(1) per bar.
+    # Matches rolling(window).max()/min(): NaN until the window is full or while it holds a NaN.
+    n = len(values)
+    out = np.full(n, np.nan)
+    ring = np.empty(window, dtype=np.int64)
+    head = 0
+    size = 0
+    nan_count = 0
+    for idx in range(n):
+        value = values[idx]
+        if idx >= window and np.isnan(values[idx - window]):
+            nan_count -= 1
+        if size > 0 and ring[head] <= idx - window:
+            head = (head + 1) % window
+            size -= 1
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            while size > 0:
+                back = values[ring[(head + size - 1) % window]]
+                if (back <= value) if is_max else (back >= value):
+                    size -= 1
+                else:
+                    break
+            ring[(head + size) % window] = idx
+            size += 1
+        if idx >= window - 1 and nan_count == 0:
+            out[idx] = values[ring[head]]
+    return out
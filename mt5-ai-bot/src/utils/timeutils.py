@@ -2,17 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, time
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 from zoneinfo import ZoneInfo
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionWindow:
     name: str
     start: time
     end: time
 
 
+# (start, end, wraps past midnight) with start/end as seconds since local midnight.
+SessionRange = Tuple[int, int, bool]
+
+
 def parse_sessions(timezone: str, windows: Iterable[dict]) -> tuple[ZoneInfo, List[SessionWindow]]:
     tz = ZoneInfo(timezone)
     parsed: List[SessionWindow] = []
@@ -23,19 +27,26 @@ def parse_sessions(timezone: str, windows: Iterable[dict]) -> tuple[ZoneInfo, Li
     return tz, parsed
 
 
-def is_in_session(dt: datetime, tz: ZoneInfo, windows: List[SessionWindow]) -> bool:
+def compile_sessions(windows: Iterable[SessionWindow]) -> Tuple[SessionRange, ...]:
+    return tuple((_seconds(window.start), _seconds(window.end), window.start > window.end) for window in windows)
+
+
+def is_in_session(dt: datetime, tz: ZoneInfo, sessions: Tuple[SessionRange, ...]) -> bool:
     local_dt = dt.astimezone(tz)
-    current = local_dt.time()
-    for window in windows:
-        if window.start <= window.end:
-            if window.start <= current <= window.end:
-                return True
-        else:
-            if current >= window.start or current <= window.end:
+    current = local_dt.hour * 3600 + local_dt.minute * 60 + local_dt.second + local_dt.microsecond / 1e6
+    for start, end, wraps in sessions:
+        if wraps:
+            if current >= start or current <= end:
                 return True
+        elif start <= current <= end:
+            return True
     return False
 
 
+def _seconds(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
 def _parse_time(value: str) -> time:
     hour, minute = value.split(":")
     return time(int(hour), int(minute))
@@ -0,0 +1,25 @@
+from src.monitoring.alerts import TelegramAlert
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+
+def test_alerts_are_batched_and_oldest_dropped_on_overflow(monkeypatch):
+    sent = []
+    alert = TelegramAlert(token="token", chat_id="chat", max_queue=2)
+    monkeypatch.setattr(alert._session, "post", lambda url, json, timeout: sent.append(json["text"]) or FakeResponse())
+    for message in ("one", "two", "three"):
+        alert._put(message)
+    alert.start()
+    alert.close()
+
+    assert alert.dropped == 1
+    assert sent == ["two\nthree"]
+
+
+def test_disabled_alert_does_not_start_worker():
+    alert = TelegramAlert(token=None, chat_id=None)
+    alert.send("ignored")
+    assert alert._worker is None
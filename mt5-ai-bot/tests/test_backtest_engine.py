@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.costs import TradingCosts
+from src.backtest.engine import run_backtest
+
+
+def make_rates(n=600, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0015, n))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.uniform(0, 0.002, n),
+            "low": np.minimum(open_, close) - rng.uniform(0, 0.002, n),
+            "close": close,
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC"),
+    )
+
+
+def test_run_backtest_equity_matches_trade_pnl():
+    df = make_rates()
+    result = run_backtest(
+        df=df,
+        initial_balance=10000,
+        breakout_N=20,
+        atr_period=14,
+        atr_min=0.0007,
+        sl_atr_mult=1.5,
+        rr_ratio=2.0,
+        ema_period=50,
+        use_trend_filter=False,
+        risk_per_trade_pct=0.5,
+        point=0.0001,
+        tick_value=10.0,
+        costs=TradingCosts(commission_per_lot=7.0, spread_points=15, slippage_points=3),
+    )
+    assert list(df.columns) == ["open", "high", "low", "close"]
+    assert len(result.equity_curve) == len(df) - 51
+    assert not result.trades.empty
+    assert (result.trades["exit_time"] > result.trades["entry_time"]).all()
+    assert result.equity_curve.iloc[-1] == pytest.approx(10000 + result.trades["pnl"].sum())
+
+
+def test_run_backtest_on_empty_frame_returns_empty_result():
+    result = run_backtest(
+        df=make_rates().iloc[:0],
+        initial_balance=10000,
+        breakout_N=20,
+        atr_period=14,
+        atr_min=0.0007,
+        sl_atr_mult=1.5,
+        rr_ratio=2.0,
+        ema_period=50,
+        use_trend_filter=True,
+        risk_per_trade_pct=0.5,
+        point=0.0001,
+        tick_value=10.0,
+        costs=TradingCosts(commission_per_lot=7.0, spread_points=15, slippage_points=3),
+    )
+    assert result.equity_curve.empty
+    assert result.trades.empty
+
+
+def test_nan_bar_only_blanks_atr_for_its_window():
+    df = make_rates()
+    df.iloc[60, df.columns.get_loc("high")] = np.nan
+    result = run_backtest(
+        df=df,
+        initial_balance=10000,
+        breakout_N=20,
+        atr_period=14,
+        atr_min=0.0007,
+        sl_atr_mult=1.5,
+        rr_ratio=2.0,
+        ema_period=50,
+        use_trend_filter=False,
+        risk_per_trade_pct=0.5,
+        point=0.0001,
+        tick_value=10.0,
+        costs=TradingCosts(commission_per_lot=7.0, spread_points=15, slippage_points=3),
+    )
+    assert (result.trades["entry_time"] > df.index[100]).any()
@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.metrics import compute_metrics
+
+
+def test_compute_metrics_matches_pandas_definitions():
+    equity = pd.Series([100.0, 101.0, 100.5, 103.0])
+    trades = pd.DataFrame({"pnl": [1.0, -0.5, 2.5], "r_multiple": [1.0, -0.5, 2.5]})
+
+    metrics = compute_metrics(equity, trades)
+
+    returns = equity.pct_change().dropna()
+    assert metrics.max_drawdown == pytest.approx(-0.5 / 101.0)
+    assert metrics.profit_factor == pytest.approx(7.0)
+    assert metrics.sharpe == pytest.approx(returns.mean() / returns.std() * np.sqrt(252))
+    assert metrics.win_rate == pytest.approx(2 / 3)
+    assert metrics.avg_r_multiple == pytest.approx(1.0)
@@ -0,0 +1,16 @@
+import numpy as np
+
+from src.strategy.donchian import DonchianWindow
+
+
+def test_donchian_window_matches_slice_extremes():
+    rng = np.random.default_rng(7)
+    highs = rng.normal(1.1, 0.01, 300)
+    lows = highs - rng.uniform(0, 0.005, 300)
+    window = DonchianWindow(20)
+    for idx in range(len(highs)):
+        window.push(highs[idx], lows[idx])
+        start = max(0, idx - 19)
+        assert window.current_high() == highs[start: idx + 1].max()
+        assert window.current_low() == lows[start: idx + 1].min()
+    assert len(window) == 20
@@ -0,0 +1,57 @@
+import pytest
+
+feather = pytest.importorskip("pyarrow.feather")
+
+import src.monitoring.journal as journal_module
+from src.monitoring.journal import FeatherTradeJournal, TradeJournal, open_trade_journal
+
+
+def make_row(ticket, time="2024-03-01T10:00:00+00:00"):
+    return {"time": time, "symbol": "EURUSD", "direction": "BUY", "volume": 0.1, "price": 1.1,
+            "sl": 1.09, "tp": 1.12, "ticket": ticket, "comment": "done"}
+
+
+def test_feather_journal_keeps_rows_across_instances(tmp_path):
+    journal = FeatherTradeJournal(directory=tmp_path)
+    journal.append(make_row(1))
+    journal.close()
+
+    journal = FeatherTradeJournal(directory=tmp_path, flush_every=10)
+    journal.append(make_row(2))
+    journal.append(make_row(3, time="2024-03-02T00:05:00+00:00"))
+    journal.close()
+
+    first_day = feather.read_table(tmp_path / "trade_journal_2024-03-01.feather")
+    second_day = feather.read_table(tmp_path / "trade_journal_2024-03-02.feather")
+    assert first_day.column("ticket").to_pylist() == [1, 2]
+    assert second_day.column("ticket").to_pylist() == [3]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_csv_journal_batches_rows_on_one_handle(tmp_path):
+    path = tmp_path / "journal.csv"
+    with TradeJournal(path=path, flush_every=2) as journal:
+        journal.append(make_row(1))
+        assert path.read_text().count("\n") == 1
+        journal.append(make_row(2))
+        assert path.read_text().count("\n") == 3
+
+    with TradeJournal(path=path) as journal:
+        journal.append(make_row(3))
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == "time,symbol,direction,volume,price,sl,tp,ticket,comment"
+    assert [line.split(",")[7] for line in lines[1:]] == ["1", "2", "3"]
+
+
+def test_open_trade_journal_falls_back_to_csv_without_pyarrow(tmp_path, monkeypatch):
+    def missing():
+        raise ImportError("no pyarrow")
+
+    monkeypatch.setattr(journal_module, "_import_feather", missing)
+    journal = open_trade_journal(tmp_path)
+    journal.append(make_row(1))
+    journal.close()
+
+    assert isinstance(journal, TradeJournal)
+    assert (tmp_path / "trade_journal.csv").read_text().splitlines()[1].startswith("2024-03-01T10:00:00+00:00,")
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.data.loader import load_parquet
+from src.data.storage import rates_to_frame, save_parquet
+
+
+def test_load_parquet_arrow_backed_columns(tmp_path):
+    n = 10
+    df = pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC"),
+            "close": np.linspace(1.1, 1.2, n),
+            "tick_volume": np.arange(n, dtype=np.int64),
+            "spread": np.full(n, 12, dtype=np.int64),
+        }
+    )
+    path = tmp_path / "EURUSD_H1.parquet"
+    save_parquet(df, path)
+
+    loaded = load_parquet(path, tz="Europe/London")
+
+    assert isinstance(loaded.index, pd.DatetimeIndex)
+    assert str(loaded.index.tz) == "Europe/London"
+    assert str(loaded["close"].dtype) == "double[pyarrow]"
+    assert str(loaded["tick_volume"].dtype) == "int32[pyarrow]"
+    assert str(loaded["spread"].dtype) == "int16[pyarrow]"
+    np.testing.assert_allclose(loaded["close"].to_numpy(dtype=np.float64), df["close"].to_numpy())
+
+
+def test_load_parquet_keeps_wide_columns_that_do_not_fit(tmp_path):
+    df = pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=2, freq="h", tz="UTC"),
+            "spread": np.array([12, 50000], dtype=np.int64),
+        }
+    )
+    path = tmp_path / "BTCUSD_H1.parquet"
+    save_parquet(df, path)
+
+    loaded = load_parquet(path, tz="UTC")
+
+    assert str(loaded["spread"].dtype) == "int64[pyarrow]"
+    assert loaded["spread"].to_numpy(dtype=np.int64).tolist() == [12, 50000]
+
+
+def test_rates_to_frame_matches_mt5_structured_array():
+    rates = np.zeros(
+        3,
+        dtype=[("time", "<i8"), ("open", "<f8"), ("high", "<f8"), ("low", "<f8"), ("close", "<f8"),
+               ("tick_volume", "<u8"), ("spread", "<i4"), ("real_volume", "<u8")],
+    )
+    rates["time"] = 1704067200 + 3600 * np.arange(3)
+    rates["close"] = [1.1, 1.2, 1.3]
+
+    df = rates_to_frame(rates)
+
+    assert list(df.columns) == list(rates.dtype.names)
+    assert df["tick_volume"].dtype == np.int32
+    assert df["spread"].dtype == np.int16
+    assert df["time"].iloc[1] == pd.Timestamp("2024-01-01 01:00", tz="UTC")
+    np.testing.assert_array_equal(df["close"].to_numpy(), rates["close"])
@@ -0,0 +1,58 @@
+import json
+import logging
+import queue
+
+import src.utils.logging as logging_module
+from src.utils.logging import BufferedRotatingFileHandler, _dumps, _RecordQueueHandler
+
+
+def test_non_finite_metrics_are_logged_the_same_with_and_without_orjson(monkeypatch):
+    payload = {"profit_factor": float("inf"), "cagr": float("nan"), "trades": 0, "comment": None}
+    expected = {"profit_factor": "Infinity", "cagr": "NaN", "trades": 0, "comment": None}
+    assert json.loads(_dumps(payload)) == expected
+    monkeypatch.setattr(logging_module, "orjson", None)
+    assert json.loads(_dumps(payload)) == expected
+    assert json.loads(_dumps({"trades": 3})) == {"trades": 3}
+
+
+def test_queued_dict_args_are_snapshotted():
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger("test_logging_snapshot")
+    logger.addHandler(_RecordQueueHandler(log_queue))
+    logger.propagate = False
+    request = {"type_filling": 1}
+    logger.warning("Built order request", {"request": request})
+    request["type_filling"] = 99
+
+    assert log_queue.get_nowait().args == {"request": {"type_filling": 1}}
+
+
+def test_file_handler_buffers_until_close_and_formats_once(tmp_path):
+    formatted = []
+
+    class CountingFormatter(logging.Formatter):
+        def format(self, record):
+            formatted.append(record)
+            return super().format(record)
+
+    path = tmp_path / "bot.log"
+    handler = BufferedRotatingFileHandler(path, maxBytes=1024 * 1024, backupCount=1)
+    handler.setFormatter(CountingFormatter())
+    for idx in range(50):
+        handler.emit(logging.makeLogRecord({"msg": f"record {idx}", "levelno": logging.INFO}))
+
+    assert path.read_text() == ""
+    assert len(formatted) == 50
+    handler.close()
+    assert len(path.read_text().splitlines()) == 50
+
+
+def test_file_handler_rotates_on_running_size(tmp_path):
+    path = tmp_path / "bot.log"
+    handler = BufferedRotatingFileHandler(path, maxBytes=100, backupCount=1)
+    for idx in range(10):
+        handler.emit(logging.makeLogRecord({"msg": "x" * 30, "levelno": logging.INFO}))
+    handler.close()
+
+    assert (tmp_path / "bot.log.1").exists()
+    assert path.stat().st_size <= 100
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.mathutils import atr, ema, rolling_max_np, rolling_min_np
+
+
+def test_atr_and_ema_match_pandas_reference():
+    rng = np.random.default_rng(3)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, 200))
+    df = pd.DataFrame({"high": close + 0.001, "low": close - 0.001, "close": close})
+
+    prev_close = df["close"].shift(1)
+    tr = pd.concat([df["high"] - df["low"], (df["high"] - prev_close).abs(), (df["low"] - prev_close).abs()], axis=1).max(axis=1)
+    pd.testing.assert_series_equal(atr(df, 14), tr.rolling(window=14, min_periods=14).mean())
+    pd.testing.assert_series_equal(ema(df["close"], 20), df["close"].ewm(span=20, adjust=False).mean())
+    assert atr(df.iloc[:0], 14).empty
+
+
+def test_rolling_extremes_match_pandas():
+    rng = np.random.default_rng(5)
+    values = rng.normal(size=300)
+    values[[10, 11, 150]] = np.nan
+    series = pd.Series(values)
+    np.testing.assert_array_equal(rolling_max_np(values, 20), series.rolling(20).max().to_numpy())
+    np.testing.assert_array_equal(rolling_min_np(values, 20), series.rolling(20).min().to_numpy())
@@ -0,0 +1,30 @@
+import numpy as np
+
+from src.data.rates_buffer import CLOSE, RatesBuffer
+
+
+RATE_DTYPE = [("time", "<i8"), ("open", "<f8"), ("high", "<f8"), ("low", "<f8"), ("close", "<f8"), ("tick_volume", "<u8")]
+
+
+def make_rates(start, count, close_offset=0.0):
+    rows = [(3600 * i, 1.0 + i, 1.1 + i, 0.9 + i, 1.0 + i + close_offset, 10 + i) for i in range(start, start + count)]
+    return np.array(rows, dtype=RATE_DTYPE)
+
+
+def test_update_appends_new_bar_and_wraps():
+    buffer = RatesBuffer(5)
+    buffer.reset(make_rates(0, 5))
+
+    assert buffer.update(make_rates(4, 2, close_offset=0.5))
+    frame = buffer.to_frame()
+    assert len(frame) == 5
+    assert buffer.last_time == 3600 * 5
+    assert list(frame["close"]) == [2.0, 3.0, 4.0, 5.5, 6.5]
+    assert frame.index.is_monotonic_increasing
+    assert list(buffer.values()[:, CLOSE]) == list(frame["close"])
+
+
+def test_update_requests_reset_on_gap():
+    buffer = RatesBuffer(5)
+    buffer.reset(make_rates(0, 5))
+    assert not buffer.update(make_rates(7, 2))
@@ -1,3 +1,7 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
 from src.execution.risk_manager import RiskLimits, RiskManager
 
 
@@ -20,3 +24,34 @@ def test_position_size_lots():
     )
     assert lots > 0
     assert lots <= 1.0
+
+
+def test_reset_if_new_day_clears_counters():
+    rm = RiskManager(limits=RiskLimits(1.0, 2.0, 3, 1))
+    rm.reset_if_new_day(datetime(2024, 3, 1, 23, 59, tzinfo=timezone.utc))
+    rm.record_trade(-50.0)
+    rm.reset_if_new_day(datetime(2024, 3, 1, 23, 59, 30, tzinfo=timezone.utc))
+    assert rm.state.trades_today == 1
+    assert rm.state.day == "2024-03-01"
+
+    rm.reset_if_new_day(datetime(2024, 3, 2, 0, 0, tzinfo=timezone.utc))
+    assert rm.state.trades_today == 0
+    assert rm.state.realized_pnl_today == 0.0
+    assert rm.state.day == "2024-03-02"
+
+
+def test_record_trades_bulk_blocks_after_daily_loss():
+    rm = RiskManager(limits=RiskLimits(1.0, 2.0, 10, 1))
+    rm.record_trades_bulk([-100.0, 50.0, -150.0])
+    assert rm.state.trades_today == 3
+    assert rm.state.realized_pnl_today == -200.0
+    assert rm.can_trade(balance=10000) == (False, "daily_loss_limit")
+    assert rm.can_trade(balance=20000) == (True, "ok")
+
+
+def test_position_size_lots_batch_matches_scalar():
+    rm = RiskManager(limits=RiskLimits(1.0, 2.0, 3, 1))
+    sl_distances = np.array([0.0010, 0.0025, 0.0, -0.001, 0.00003])
+    lots = rm.position_size_lots_batch(10000, sl_distances, 0.0001, 10, 0.01, 0.01, 1.0)
+    expected = [rm.position_size_lots(10000, sl, 0.0001, 10, 0.01, 0.01, 1.0) for sl in sl_distances]
+    np.testing.assert_allclose(lots, expected)
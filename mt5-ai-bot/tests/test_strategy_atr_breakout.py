@@ -1,6 +1,7 @@
 import pandas as pd
+import pytest
 
-from src.strategy.atr_breakout import compute_signal
+from src.strategy.atr_breakout import compute_signal, precompute_signals
 
 
 def test_breakout_signal_buy():
@@ -13,3 +14,20 @@ def test_breakout_signal_buy():
     df = pd.DataFrame(data)
     signal = compute_signal(df, breakout_N=20, atr_period=14, atr_min=0.0001, ema_period=5, use_trend_filter=False)
     assert signal.direction == 1
+
+
+def test_precompute_signals_matches_compute_signal():
+    closes = [1.0 + 0.001 * ((i * 7) % 11) - 0.0005 * i for i in range(40)]
+    df = pd.DataFrame({
+        "open": closes,
+        "high": [c + 0.002 for c in closes],
+        "low": [c - 0.002 for c in closes],
+        "close": closes,
+    })
+    arrays = precompute_signals(df, breakout_N=10, ema_period=8)
+    for idx in range(11, len(df)):
+        signal = compute_signal(df.iloc[: idx + 1], breakout_N=10, atr_period=5, atr_min=0.0, ema_period=8,
+                                use_trend_filter=False)
+        assert arrays.breakout_high[idx] == pytest.approx(signal.breakout_high)
+        assert arrays.breakout_low[idx] == pytest.approx(signal.breakout_low)
+        assert arrays.ema[idx] - arrays.ema[idx - 1] == pytest.approx(signal.ema_slope)